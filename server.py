@@ -16,6 +16,13 @@ Tools (MUST be called in order):
 1. get_view_schema_and_samples - ⚠️ REQUIRED FIRST: Returns schema and sample data
 2. execute_custom_query - Generates comprehensive performance reports with period categorization
 
+Report shortcuts (no SQL, can be called directly):
+- get_daily_report - Full report for one restaurant on one date
+- get_weekly_trend - Daily rows for one restaurant over a date range
+
+Diagnostics:
+- get_cache_stats - Returns response cache hit/miss statistics
+
 WORKFLOW:
 - Always call Tool 1 first to understand available columns
 - Then use Tool 2 to generate reports with comprehensive data by default
@@ -23,15 +30,31 @@ WORKFLOW:
 Security: Read-only queries only, SQL injection prevention enforced
 """
 
-import os
+import asyncio
 import json
+import os
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+import httpx
+import orjson
+import sqlglot
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator
-from supabase import create_client, Client
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
+from supabase import create_client, Client, ClientOptions
+
+try:
+    import hyperscan  # Optional: SIMD multi-pattern prefilter for keyword blocking
+except ImportError:
+    hyperscan = None
 
 # Load environment variables
 load_dotenv()
@@ -41,6 +64,91 @@ CHARACTER_LIMIT = 25000
 VIEW_NAME = "roleplay_daily_reports"
 DEFAULT_ROW_LIMIT = 100
 MAX_ROW_LIMIT = 1000
+COLUMNAR_MIN_ROWS = 10  # larger results are returned as {"columns", "rows"}
+
+# Responses are compact JSON; PRETTY=1 indents them for debugging (at the cost of
+# ~30% of the CHARACTER_LIMIT budget)
+PRETTY_JSON = os.getenv("PRETTY") == "1"
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+
+# Precompiled SQL patterns (used on every execute_custom_query call)
+# Word boundaries avoid false positives (e.g., "UPDATED_AT" does not match UPDATE).
+# Case-insensitive matching avoids upper-casing the (often CJK-heavy) query text.
+DANGEROUS_KEYWORDS = (
+    'INSERT', 'UPDATE', 'DELETE', 'DROP', 'ALTER', 'CREATE',
+    'TRUNCATE', 'GRANT', 'REVOKE', 'EXEC', 'EXECUTE',
+    'PROCEDURE', 'FUNCTION', 'TRIGGER', 'INDEX', 'VIEW',
+    'SCHEMA', 'DATABASE', 'TABLE', 'COLUMN', 'INTO'
+)
+DANGEROUS_KW_RE = re.compile(
+    r'\b(?:' + '|'.join(DANGEROUS_KEYWORDS) + r')\b',
+    re.IGNORECASE
+)
+
+# Hyperscan database for the same keywords (single DFA pass over the UTF-8 bytes).
+# Its \b is ASCII-only, so it matches a superset of DANGEROUS_KW_RE (e.g., next to
+# CJK characters); hits are confirmed with the regex, keeping its exact semantics.
+if hyperscan is not None:
+    _KEYWORD_DB = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    _KEYWORD_DB.compile(
+        expressions=[rb'\b' + kw.encode('ascii') + rb'\b' for kw in DANGEROUS_KEYWORDS],
+        ids=list(range(len(DANGEROUS_KEYWORDS))),
+        elements=len(DANGEROUS_KEYWORDS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(DANGEROUS_KEYWORDS)
+    )
+else:
+    _KEYWORD_DB = None
+
+# Column descriptions: Chinese column name -> (English name, description)
+COLUMN_MAPPING: Mapping[str, tuple[str, str]] = MappingProxyType({
+    "报表唯一标识": ("report_id", "每条记录的唯一标识"),
+    "运营日期": ("operating_date", "报表对应的运营日期"),
+    "餐厅ID": ("restaurant_id", "餐厅的唯一标识"),
+    "餐厅完整名称": ("restaurant_name", "餐厅名称（品牌-城市-门店）"),
+    "总任务数量": ("total_tasks", "当天所有任务的总数"),
+    "已完成任务数量": ("completed_tasks", "当天已完成的任务数量"),
+    "总体任务完成率": ("overall_completion_rate", "总体任务完成百分比 (0-100)"),
+    "总体任务准时率": ("overall_ontime_rate", "总体任务准时完成百分比 (0-100)"),
+    "店长总任务数量": ("manager_total_tasks", "店长角色的总任务数"),
+    "店长已完成任务数量": ("manager_completed_tasks", "店长已完成的任务数"),
+    "店长任务完成率": ("manager_completion_rate", "店长任务完成百分比"),
+    "店长任务准时率": ("manager_ontime_rate", "店长任务准时完成百分比"),
+    "值班经理总任务数量": ("duty_manager_total_tasks", "值班经理角色的总任务数"),
+    "值班经理已完成任务数量": ("duty_manager_completed_tasks", "值班经理已完成的任务数"),
+    "值班经理任务完成率": ("duty_manager_completion_rate", "值班经理任务完成百分比"),
+    "值班经理任务准时率": ("duty_manager_ontime_rate", "值班经理任务准时完成百分比"),
+    "厨师总任务数量": ("chef_total_tasks", "厨师角色的总任务数"),
+    "厨师已完成任务数量": ("chef_completed_tasks", "厨师已完成的任务数"),
+    "厨师任务完成率": ("chef_completion_rate", "厨师任务完成百分比"),
+    "厨师任务准时率": ("chef_ontime_rate", "厨师任务准时完成百分比"),
+    "手动闭店任务是否完成": ("manual_closing_completed", "手动闭店任务的完成状态 (true/false)"),
+    "闭店任务ID": ("closing_task_id", "闭店任务的唯一标识"),
+})
+
+# JSON value type -> schema data type (exact type match keeps bool distinct from int)
+_TYPE_MAP = {bool: "boolean", int: "integer", float: "numeric", str: "text"}
+
+# AST nodes that make a parsed query non-read-only (e.g., DELETE inside a CTE)
+FORBIDDEN_NODES = (
+    exp.Insert, exp.Update, exp.Delete, exp.Merge, exp.Create, exp.Drop,
+    exp.Alter, exp.TruncateTable, exp.Command, exp.Into, exp.Lock
+)
+
+LIMIT_EXTRACT_RE = re.compile(r'\bLIMIT\s+(\d+)', re.IGNORECASE)
+LIMIT_REPLACE_RE = re.compile(r'\bLIMIT\s+\d+', re.IGNORECASE)
+
+# Response caches (the materialized view refreshes at most daily)
+SCHEMA_CACHE_TTL = 300  # seconds
+_SCHEMA_CACHE: Dict[str, tuple[float, str]] = {}  # view name -> (stored at, encoded response)
+_RESTAURANT_NAMES: Dict[str, List[str]] = {}  # view name -> restaurant names from the last schema fetch
+QUERY_CACHE_TTL = 30  # seconds
+QUERY_CACHE_MAX = 256
+_QUERY_CACHE: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()  # (query, row limit) -> (stored at, encoded hit response)
+_CACHE_STATS: Dict[str, Dict[str, int]] = {
+    "schema": {"hits": 0, "misses": 0},
+    "query": {"hits": 0, "misses": 0}
+}
+_CACHE_LOCK = threading.Lock()
 
 # Initialize Supabase client
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -49,8 +157,22 @@ SUPABASE_KEY = os.getenv("SUPABASE_ANON_KEY")
 if not SUPABASE_URL or not SUPABASE_KEY:
     raise ValueError("Missing required environment variables: SUPABASE_URL or SUPABASE_ANON_KEY")
 
+# Long-lived HTTP/2 connection pool so queries reuse one TLS session.
+# No custom transport: httpx only honors proxy env vars (SOCKS) with its default transport.
+# Timeout and redirect handling match postgrest's default client (120s, follow redirects).
+http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300),
+    timeout=httpx.Timeout(120.0, connect=10.0),
+    follow_redirects=True
+)
+
 # Using ANON key - respects RLS policies, safer than service_role key
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+supabase: Client = create_client(
+    SUPABASE_URL,
+    SUPABASE_KEY,
+    options=ClientOptions(httpx_client=http_client)
+)
 
 # Initialize FastMCP server with workflow instructions
 mcp = FastMCP(
@@ -67,6 +189,10 @@ WHY THIS MATTERS:
 - Without the schema, you'll write incorrect queries that will fail
 - The schema tool shows you all available columns with descriptions
 
+SHORTCUTS (no SQL needed, can be called without the schema):
+- 📅 get_daily_report for one restaurant on one date
+- 📈 get_weekly_trend for one restaurant over a date range
+
 """
 )
 
@@ -106,36 +232,139 @@ class CustomQueryInput(BaseModel):
 
 
 # Utility functions
+def _encode(obj: Any) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes with orjson (C encoder), compact unless PRETTY=1.
+
+    Falls back to the stdlib encoder for values orjson rejects, such as
+    integers beyond 64 bits from large NUMERIC results.
+
+    Returns:
+        Encoded JSON bytes
+    """
+    try:
+        return orjson.dumps(obj, option=_JSON_OPTIONS)
+    except TypeError:
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            indent=2 if PRETTY_JSON else None,
+            separators=(',', ': ') if PRETTY_JSON else (',', ':'),
+            default=str
+        ).encode('utf-8')
+
+
+def _encoded_size(obj: Any) -> int:
+    """
+    Get the UTF-8 byte length of the serialized JSON without decoding it to str.
+
+    Returns:
+        Number of bytes the response occupies on the MCP transport
+    """
+    return len(_encode(obj))
+
+
+def _stop_on_first_match(match_id: int, start: int, end: int, flags: int, hits: List[int]) -> bool:
+    """Hyperscan match handler: record the pattern id and stop scanning."""
+    hits.append(match_id)
+    return True
+
+
+def find_dangerous_keyword(query: str) -> Optional[str]:
+    """
+    Find the first blocked keyword in a query.
+
+    Uses the hyperscan prefilter when installed, so clean queries (the common
+    case) cost one DFA pass; DANGEROUS_KW_RE gives the final answer otherwise.
+    Scans run on the event loop thread only (the database scratch is not shared).
+
+    Returns:
+        Upper-cased keyword, or None if the query contains no blocked keyword
+    """
+    if _KEYWORD_DB is not None:
+        hits: List[int] = []
+        try:
+            _KEYWORD_DB.scan(query.encode('utf-8'), match_event_handler=_stop_on_first_match, context=hits)
+        except hyperscan.ScanTerminated:
+            pass
+        if not hits:
+            return None
+
+    match = DANGEROUS_KW_RE.search(query)
+    return match.group().upper() if match else None
+
+
+@lru_cache(maxsize=512)
+def _parse_query(query: str) -> exp.Expression:
+    """
+    Parse a query with the Postgres dialect (cached by raw query text).
+
+    The cached tree is shared - call .copy() before modifying it.
+
+    Raises:
+        SqlglotError: If the query cannot be parsed
+    """
+    return sqlglot.parse_one(query, read='postgres')
+
+
 def validate_query_safety(query: str) -> tuple[bool, Optional[str]]:
     """
     Validate that query is safe and read-only.
 
+    Cheap prefix and keyword checks run first; parseable queries are then
+    checked structurally (single read-only SELECT statement).
+
     Returns:
         (is_valid, error_message): Tuple of boolean and optional error message
     """
-    query_upper = query.strip().upper()
+    stripped = query.lstrip()
 
-    # Must start with SELECT
-    if not query_upper.startswith('SELECT'):
+    # Must start with SELECT (keywords are ASCII, so only the prefix is upper-cased)
+    # An identifier character right after SELECT means a different word (e.g., SELECTX)
+    next_char = stripped[6:7]
+    if stripped[:6].upper() != 'SELECT' or next_char.isalnum() or next_char == '_':
         return False, "Only SELECT queries are allowed. Your query must start with SELECT."
 
-    # Block dangerous keywords
-    dangerous_keywords = [
-        'INSERT', 'UPDATE', 'DELETE', 'DROP', 'ALTER', 'CREATE',
-        'TRUNCATE', 'GRANT', 'REVOKE', 'EXEC', 'EXECUTE',
-        'PROCEDURE', 'FUNCTION', 'TRIGGER', 'INDEX', 'VIEW',
-        'SCHEMA', 'DATABASE', 'TABLE', 'COLUMN', 'INTO'
-    ]
+    # Block dangerous keywords (single case-insensitive scan over the combined pattern)
+    keyword = find_dangerous_keyword(query)
+    if keyword:
+        return False, f"Keyword '{keyword}' is not allowed. Only read-only SELECT queries are permitted."
+
+    # Structural check; queries sqlglot cannot parse rely on the checks above
+    try:
+        tree = _parse_query(query)
+    except SqlglotError:
+        return True, None
+
+    if not isinstance(tree, exp.Query):
+        return False, "Only a single SELECT statement is allowed."
 
-    for keyword in dangerous_keywords:
-        # Use word boundaries to avoid false positives (e.g., "DELETE" in comments)
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, query_upper):
-            return False, f"Keyword '{keyword}' is not allowed. Only read-only SELECT queries are permitted."
+    node = tree.find(*FORBIDDEN_NODES)
+    if node is not None:
+        return False, f"'{node.key.upper()}' is not allowed. Only read-only SELECT queries are permitted."
 
     return True, None
 
 
+def _literal_limit(limit: Optional[exp.Expression]) -> Optional[int]:
+    """
+    Get the row count of a LIMIT or FETCH FIRST node if it is an integer literal.
+
+    Returns:
+        Row count, or None if there is no limit or it is not a literal (e.g., LIMIT ALL)
+    """
+    if isinstance(limit, exp.Limit):
+        count = limit.expression
+    elif isinstance(limit, exp.Fetch):
+        count = limit.args.get('count')
+    else:
+        return None
+
+    if isinstance(count, exp.Literal) and count.is_int:
+        return int(count.name)
+    return None
+
+
 def enforce_row_limit(query: str, row_limit: int) -> str:
     """
     Ensure query has a LIMIT clause. Add one if missing or modify if exceeds max.
@@ -147,70 +376,161 @@ def enforce_row_limit(query: str, row_limit: int) -> str:
     Returns:
         Modified query with enforced LIMIT
     """
-    query_upper = query.strip().upper()
-
-    # Check if LIMIT already exists
-    if 'LIMIT' in query_upper:
-        # Extract existing limit
-        match = re.search(r'\bLIMIT\s+(\d+)', query_upper)
-        if match:
-            existing_limit = int(match.group(1))
-            if existing_limit > row_limit:
-                # Replace with enforced limit
-                query = re.sub(
-                    r'\bLIMIT\s+\d+',
-                    f'LIMIT {row_limit}',
-                    query,
-                    flags=re.IGNORECASE
-                )
-    else:
-        # Add LIMIT clause
-        query = query.strip()
-        if query.endswith(';'):
-            query = query[:-1]
-        query = f"{query} LIMIT {row_limit}"
+    # Rewrite the outermost LIMIT on the AST (ignores subquery limits and comments,
+    # handles FETCH FIRST); same cache key as validate_query_safety
+    try:
+        tree = _parse_query(query)
+    except SqlglotError:
+        tree = None
+
+    # Normalize once: drop trailing whitespace and semicolons (execute_sql wraps
+    # the query in a subquery, where a trailing semicolon is a syntax error)
+    query = query.rstrip().rstrip(';').rstrip()
+
+    if isinstance(tree, exp.Query):
+        existing_limit = _literal_limit(tree.args.get('limit'))
+        if existing_limit is not None and existing_limit <= row_limit:
+            return query
+
+        tree = tree.copy()
+        tree.set('limit', exp.Limit(expression=exp.Literal.number(row_limit)))
+        return tree.sql(dialect='postgres')
 
-    return query
+    # Fallback for queries sqlglot cannot parse
+    # Fast path: no LIMIT yet, just append one
+    match = LIMIT_EXTRACT_RE.search(query)
+    if not match:
+        return f"{query} LIMIT {row_limit}"
+
+    # Existing LIMIT within bounds is kept as-is
+    if int(match.group(1)) <= row_limit:
+        return query
+
+    # Replace with enforced limit
+    return LIMIT_REPLACE_RE.sub(f'LIMIT {row_limit}', query)
 
 
 def truncate_response(data: Any, max_chars: int = CHARACTER_LIMIT) -> tuple[Any, bool]:
     """
-    Truncate response data if it exceeds character limit.
+    Truncate response data if it exceeds the size limit.
+
+    Size is measured as UTF-8 bytes of the encoded JSON, which is what the
+    MCP transport carries (CJK characters count as 3).
 
     Args:
         data: Response data to truncate
-        max_chars: Maximum character limit
+        max_chars: Maximum size limit
 
     Returns:
         (truncated_data, was_truncated): Tuple of data and truncation flag
     """
-    json_str = json.dumps(data, ensure_ascii=False, indent=2)
+    total_size = _encoded_size(data)
 
-    if len(json_str) <= max_chars:
+    if total_size <= max_chars:
         return data, False
 
     # Truncate rows if data is a list
     if isinstance(data, list) and len(data) > 1:
-        # Binary search to find optimal row count
-        left, right = 1, len(data)
-        result_rows = 1
-
-        while left <= right:
-            mid = (left + right) // 2
-            test_data = data[:mid]
-            test_str = json.dumps(test_data, ensure_ascii=False, indent=2)
-
-            if len(test_str) <= max_chars:
-                result_rows = mid
-                left = mid + 1
-            else:
-                right = mid - 1
+        # Estimate the fitting row count from the average serialized row size,
+        # then correct it (typically 1-3 serializations instead of a binary search)
+        avg_row_chars = total_size / len(data)
+        result_rows = max(1, min(len(data) - 1, int((max_chars - 50) / avg_row_chars)))
+        size = _encoded_size(data[:result_rows])
+
+        # Overshoot: drop enough rows to cover the excess until it fits
+        while size > max_chars and result_rows > 1:
+            result_rows = max(1, result_rows - max(1, int((size - max_chars) / avg_row_chars)))
+            size = _encoded_size(data[:result_rows])
+
+        # Undershoot: try to fill the remaining budget once
+        extra_rows = int((max_chars - size) / avg_row_chars)
+        if size <= max_chars and extra_rows > 0 and result_rows + extra_rows < len(data):
+            if _encoded_size(data[:result_rows + extra_rows]) <= max_chars:
+                result_rows += extra_rows
 
         return data[:result_rows], True
 
     return data, True
 
 
+def encode_response(
+    response: Dict[str, Any],
+    max_chars: int = CHARACTER_LIMIT,
+    rows_key: Optional[str] = None
+) -> str:
+    """
+    Serialize a tool response once, truncating it to fit the size limit.
+
+    The returned JSON text is the tool result itself, so FastMCP does not
+    serialize the response dictionary a second time.
+
+    Args:
+        response: Tool response dictionary
+        max_chars: Maximum size limit
+        rows_key: Key of the row list to shrink when the response is too large
+
+    Returns:
+        JSON string of the (possibly truncated) response
+    """
+    encoded = _encode(response)
+
+    if len(encoded) <= max_chars:
+        return encoded.decode('utf-8')
+
+    truncated = dict(response)
+    truncated["_truncated"] = True
+    truncated["_message"] = f"Response was truncated to fit within {max_chars} byte limit (UTF-8 encoded JSON)"
+
+    # Row list lives either directly under rows_key or in a columnar {"columns", "rows"} object
+    container = response.get(rows_key) if rows_key else None
+    columnar = isinstance(container, dict)
+    rows = container.get("rows") if columnar else container
+
+    def with_rows(kept: List[Any]) -> Any:
+        return {**container, "rows": kept} if columnar else kept
+
+    if isinstance(rows, list) and len(rows) > 1:
+        truncated["_message"] += f". Original row count: {len(rows)}"
+
+        # Rows share the budget with the rest of the envelope
+        envelope_size = _encoded_size({**truncated, rows_key: with_rows([])})
+        kept_rows, _ = truncate_response(rows, max(1, max_chars - envelope_size))
+        truncated[rows_key] = with_rows(kept_rows)
+        encoded = _encode(truncated)
+
+        # Nested rows may encode larger (indentation with PRETTY=1); trim further if over
+        while len(encoded) > max_chars and len(kept_rows) > 1:
+            kept_rows = kept_rows[:max(1, int(len(kept_rows) * max_chars / len(encoded)))]
+            truncated[rows_key] = with_rows(kept_rows)
+            encoded = _encode(truncated)
+
+        return encoded.decode('utf-8')
+
+    return _encode(truncated).decode('utf-8')
+
+
+def to_columnar(data: Any) -> Any:
+    """
+    Convert a list of row objects to columnar form once it exceeds COLUMNAR_MIN_ROWS.
+
+    Column names are emitted once instead of being repeated in every row,
+    which shrinks wide results with long Chinese column names considerably.
+
+    Args:
+        data: Query rows (list of dictionaries with identical keys)
+
+    Returns:
+        {"columns": [...], "rows": [[...], ...]} for large results, else data unchanged
+    """
+    if not isinstance(data, list) or len(data) <= COLUMNAR_MIN_ROWS:
+        return data
+
+    return {
+        "columns": list(data[0].keys()),
+        "rows": [list(row.values()) for row in data]
+    }
+
+
 def format_error_response(
     error_type: str,
     message: str,
@@ -241,6 +561,66 @@ def format_error_response(
     return response
 
 
+async def execute_sql(query: str) -> Any:
+    """
+    Run a query through the Supabase execute_sql RPC without blocking the event loop.
+
+    The synchronous client call runs in a worker thread so concurrent MCP
+    requests are not serialized behind network round trips.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        Supabase API response (rows in .data)
+    """
+    return await asyncio.to_thread(
+        lambda: supabase.rpc('execute_sql', {'query': query}).execute()
+    )
+
+
+async def fetch_query_rows(validated_query: str) -> tuple[Any, bool]:
+    """
+    Fetch query rows, skipping rows that could not fit in the response anyway.
+
+    The query runs once, wrapped so the database accumulates each row's encoded
+    value size in a running window sum and returns rows only while the bytes
+    before them are under CHARACTER_LIMIT. Rows past the budget never leave the
+    database; the row that crosses it is still returned so truncation decides.
+
+    Args:
+        validated_query: Query with enforced LIMIT
+
+    Returns:
+        (data, more_rows): Query rows (or execute_sql error object) and whether
+        rows were left unfetched
+    """
+    # Value bytes plus commas and brackets approximate the row's columnar encoding
+    sized_query = f"""
+    SELECT * FROM (
+        SELECT t.*,
+            SUM(s.row_bytes) OVER (ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING) AS _mcp_prior_bytes,
+            COUNT(*) OVER () AS _mcp_total_rows
+        FROM ({validated_query}) t
+        CROSS JOIN LATERAL (
+            SELECT SUM(octet_length(v.value::text)) + COUNT(*) + 2 AS row_bytes
+            FROM json_each(row_to_json(t)) v
+        ) s
+    ) _sized
+    WHERE COALESCE(_mcp_prior_bytes, 0) < {CHARACTER_LIMIT}
+    """
+    result = await execute_sql(sized_query)
+    data = result.data if hasattr(result, 'data') else []
+    if not isinstance(data, list) or not data:
+        return data, False
+
+    total_rows = data[0].get('_mcp_total_rows', len(data))
+    for row in data:
+        row.pop('_mcp_prior_bytes', None)
+        row.pop('_mcp_total_rows', None)
+    return data, len(data) < total_rows
+
+
 # MCP Tool Implementations
 
 @mcp.tool(
@@ -255,7 +635,8 @@ WORKFLOW:
 This tool returns:
 - All columns' definitions (Chinese names, English names, data types, descriptions)
 - 5 most recent sample records
-- Database metadata (row count, date range, restaurant list)
+- Database metadata (row count, date range, restaurant list; row count and dates
+  are planner estimates when "estimated" is true)
 - SQL query usage hints
 
 IMPORTANT: All column names are in Chinese and require double quotes in queries.
@@ -263,9 +644,10 @@ Example: "餐厅完整名称", "总体任务完成率"
 
 获取 roleplay_daily_reports 视图的完整结构和示例数据。
 
-返回格式: JSON object with schema, samples, metadata, and usage hints"""
+返回格式: JSON object with schema, samples, metadata, and usage hints""",
+    structured_output=False
 )
-def get_view_schema_and_samples() -> Dict[str, Any]:
+async def get_view_schema_and_samples() -> str:
     """
     Get complete schema information and sample data from roleplay_daily_reports view.
 
@@ -273,7 +655,7 @@ def get_view_schema_and_samples() -> Dict[str, Any]:
     including column definitions, sample data, and query usage hints.
 
     Returns:
-        JSON response containing:
+        JSON string (pre-serialized, returned as text content) containing:
         - view_name: Name of the materialized view
         - description: Brief description of the view
         - columns: List of all columns with names, types, and descriptions
@@ -284,61 +666,89 @@ def get_view_schema_and_samples() -> Dict[str, Any]:
     Raises:
         Exception: If database query fails
     """
+    return await _load_schema()
+
+
+async def _load_schema(record_stats: bool = True) -> str:
+    """
+    Build the encoded schema response, serving it from cache while fresh.
+
+    Args:
+        record_stats: Count this lookup in _CACHE_STATS (False for internal
+            callers, so get_cache_stats reflects client traffic only)
+
+    Returns:
+        Encoded schema response (or encoded error response)
+    """
+    # Serve from cache while fresh (keyed by view name)
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        entry = _SCHEMA_CACHE.get(VIEW_NAME)
+        if entry and now - entry[0] < SCHEMA_CACHE_TTL:
+            if record_stats:
+                _CACHE_STATS["schema"]["hits"] += 1
+            return entry[1]
+        if record_stats:
+            _CACHE_STATS["schema"]["misses"] += 1
+
     try:
-        # 1. Get sample data first (we'll use it to get column names)
-        sample_query = f'SELECT * FROM {VIEW_NAME} ORDER BY "运营日期" DESC LIMIT 5'
-        sample_result = supabase.rpc('execute_sql', {'query': sample_query}).execute()
-        sample_data = sample_result.data if hasattr(sample_result, 'data') else []
+        # 1. Fetch samples, planner statistics and restaurant names in one round trip
+        # Date range comes from histogram bounds plus most common values, since
+        # frequent values are excluded from the histogram
+        schema_query = f"""
+        SELECT json_build_object(
+            'samples', (
+                SELECT json_agg(t) FROM (
+                    SELECT * FROM {VIEW_NAME} ORDER BY "运营日期" DESC LIMIT 5
+                ) t
+            ),
+            'stats', (
+                SELECT json_agg(st) FROM (
+                    SELECT
+                        c.reltuples::bigint as total_rows,
+                        s.attname,
+                        (SELECT MIN(v) FROM unnest(
+                            COALESCE(s.histogram_bounds::text::text[], '{{}}'::text[])
+                            || COALESCE(s.most_common_vals::text::text[], '{{}}'::text[])
+                        ) AS v) as min_value,
+                        (SELECT MAX(v) FROM unnest(
+                            COALESCE(s.histogram_bounds::text::text[], '{{}}'::text[])
+                            || COALESCE(s.most_common_vals::text::text[], '{{}}'::text[])
+                        ) AS v) as max_value
+                    FROM pg_class c
+                    LEFT JOIN pg_stats s
+                        ON s.schemaname = 'public'
+                        AND s.tablename = c.relname
+                        AND s.attname = '运营日期'
+                    WHERE c.relname = '{VIEW_NAME}' AND c.relnamespace = 'public'::regnamespace
+                ) st
+            ),
+            'restaurants', (
+                SELECT json_agg(r."餐厅完整名称" ORDER BY r."餐厅完整名称") FROM (
+                    SELECT DISTINCT "餐厅完整名称" FROM {VIEW_NAME}
+                ) r
+            )
+        ) as bundle
+        """
+        schema_result = await execute_sql(schema_query)
+        bundle = schema_result.data[0]['bundle'] if hasattr(schema_result, 'data') and schema_result.data else {}
+        sample_data = bundle.get('samples') or []
 
         # Extract column names from sample data (first row's keys)
-        actual_columns = list(sample_data[0].keys()) if sample_data and len(sample_data) > 0 else []
+        first_row = sample_data[0] if sample_data else None
+        actual_columns = list(first_row.keys()) if first_row is not None else []
 
         # Parse column data with descriptions
         columns = []
-        column_mapping = {
-            "报表唯一标识": ("report_id", "每条记录的唯一标识"),
-            "运营日期": ("operating_date", "报表对应的运营日期"),
-            "餐厅ID": ("restaurant_id", "餐厅的唯一标识"),
-            "餐厅完整名称": ("restaurant_name", "餐厅名称（品牌-城市-门店）"),
-            "总任务数量": ("total_tasks", "当天所有任务的总数"),
-            "已完成任务数量": ("completed_tasks", "当天已完成的任务数量"),
-            "总体任务完成率": ("overall_completion_rate", "总体任务完成百分比 (0-100)"),
-            "总体任务准时率": ("overall_ontime_rate", "总体任务准时完成百分比 (0-100)"),
-            "店长总任务数量": ("manager_total_tasks", "店长角色的总任务数"),
-            "店长已完成任务数量": ("manager_completed_tasks", "店长已完成的任务数"),
-            "店长任务完成率": ("manager_completion_rate", "店长任务完成百分比"),
-            "店长任务准时率": ("manager_ontime_rate", "店长任务准时完成百分比"),
-            "值班经理总任务数量": ("duty_manager_total_tasks", "值班经理角色的总任务数"),
-            "值班经理已完成任务数量": ("duty_manager_completed_tasks", "值班经理已完成的任务数"),
-            "值班经理任务完成率": ("duty_manager_completion_rate", "值班经理任务完成百分比"),
-            "值班经理任务准时率": ("duty_manager_ontime_rate", "值班经理任务准时完成百分比"),
-            "厨师总任务数量": ("chef_total_tasks", "厨师角色的总任务数"),
-            "厨师已完成任务数量": ("chef_completed_tasks", "厨师已完成的任务数"),
-            "厨师任务完成率": ("chef_completion_rate", "厨师任务完成百分比"),
-            "厨师任务准时率": ("chef_ontime_rate", "厨师任务准时完成百分比"),
-            "手动闭店任务是否完成": ("manual_closing_completed", "手动闭店任务的完成状态 (true/false)"),
-            "闭店任务ID": ("closing_task_id", "闭店任务的唯一标识"),
-        }
 
-        # Build column list from actual data
+        # Build column list from actual data (loop only runs when first_row exists)
+        mapping_get = COLUMN_MAPPING.get
+        type_map_get = _TYPE_MAP.get
         for col_name in actual_columns:
-            english_name, description = column_mapping.get(col_name, (col_name, "列数据"))
+            english_name, description = mapping_get(col_name) or (col_name, "列数据")
 
             # Infer data type from sample data
-            data_type = "unknown"
-            if sample_data and len(sample_data) > 0:
-                value = sample_data[0].get(col_name)
-                if value is not None:
-                    if isinstance(value, bool):
-                        data_type = "boolean"
-                    elif isinstance(value, int):
-                        data_type = "integer"
-                    elif isinstance(value, float):
-                        data_type = "numeric"
-                    elif isinstance(value, str):
-                        data_type = "text"
-                    else:
-                        data_type = "unknown"
+            data_type = type_map_get(type(first_row[col_name]), "unknown")
 
             columns.append({
                 "name": col_name,
@@ -347,22 +757,33 @@ def get_view_schema_and_samples() -> Dict[str, Any]:
                 "description": description
             })
 
-        # 2. Get metadata
-        metadata_query = f"""
-        SELECT
-            COUNT(*) as total_rows,
-            MIN("运营日期") as earliest_date,
-            MAX("运营日期") as latest_date,
-            COUNT(DISTINCT "餐厅ID") as restaurant_count
-        FROM {VIEW_NAME}
-        """
-        metadata_result = supabase.rpc('execute_sql', {'query': metadata_query}).execute()
-        metadata_raw = metadata_result.data[0] if hasattr(metadata_result, 'data') and metadata_result.data else {}
-
-        # Get distinct restaurant names
-        restaurant_query = f'SELECT DISTINCT "餐厅完整名称" FROM {VIEW_NAME} ORDER BY "餐厅完整名称"'
-        restaurant_result = supabase.rpc('execute_sql', {'query': restaurant_query}).execute()
-        restaurants = [r.get('餐厅完整名称', '') for r in (restaurant_result.data if hasattr(restaurant_result, 'data') else [])]
+        # 2. Get metadata from planner statistics (catalog lookup instead of a full scan)
+        stats_rows = bundle.get('stats') or []
+        total_rows = stats_rows[0].get('total_rows', -1) if stats_rows else -1
+        column_stats = {r['attname']: r for r in stats_rows if r.get('attname')}
+        date_stats = column_stats.get('运营日期')
+
+        if total_rows >= 0 and date_stats:
+            metadata_raw = {
+                'total_rows': total_rows,
+                'earliest_date': date_stats.get('min_value'),
+                'latest_date': date_stats.get('max_value'),
+                'estimated': True
+            }
+        else:
+            # View has never been analyzed (reltuples = -1) - fall back to exact aggregates
+            metadata_query = f"""
+            SELECT
+                COUNT(*) as total_rows,
+                MIN("运营日期") as earliest_date,
+                MAX("运营日期") as latest_date
+            FROM {VIEW_NAME}
+            """
+            metadata_result = await execute_sql(metadata_query)
+            metadata_raw = metadata_result.data[0] if hasattr(metadata_result, 'data') and metadata_result.data else {}
+
+        # Distinct restaurant names (already sorted by the database), without NULLs
+        restaurants = [name for name in (bundle.get('restaurants') or []) if name]
 
         # Build response
         response = {
@@ -377,7 +798,8 @@ def get_view_schema_and_samples() -> Dict[str, Any]:
                     "earliest": str(metadata_raw.get('earliest_date', '')),
                     "latest": str(metadata_raw.get('latest_date', ''))
                 },
-                "restaurant_count": metadata_raw.get('restaurant_count', 0),
+                "restaurant_count": len(restaurants),
+                "estimated": metadata_raw.get('estimated', False),
                 "restaurants": restaurants
             },
             "usage_hints": [
@@ -391,20 +813,22 @@ def get_view_schema_and_samples() -> Dict[str, Any]:
             ]
         }
 
-        # Truncate if needed
-        truncated_response, was_truncated = truncate_response(response)
-        if was_truncated:
-            truncated_response["_truncated"] = True
-            truncated_response["_message"] = f"Response was truncated to fit within {CHARACTER_LIMIT} character limit"
+        # Encode once (truncating if needed); the cache keeps the encoded form
+        encoded_response = encode_response(response)
+
+        # Cache successful responses only; errors are retried on the next call
+        with _CACHE_LOCK:
+            _SCHEMA_CACHE[VIEW_NAME] = (now, encoded_response)
+            _RESTAURANT_NAMES[VIEW_NAME] = restaurants
 
-        return truncated_response
+        return encoded_response
 
     except Exception as e:
-        return format_error_response(
+        return encode_response(format_error_response(
             error_type="DatabaseError",
             message=f"Failed to retrieve schema and samples: {str(e)}",
             suggestion="Please check database connection and ensure the roleplay_daily_reports view exists."
-        )
+        ))
 
 
 @mcp.tool(
@@ -435,7 +859,7 @@ overall, role-based, and period-based dimensions.
 - Multi-restaurant comparison: Omit restaurant filter, GROUP BY "餐厅完整名称"
 - Opening/closing analysis: Use period columns (开店时段任务完成率, etc.)
 
-**Security**: SELECT-only, max 1000 rows, 25k character limit applies.
+**Security**: SELECT-only, max 1000 rows, 25,000-byte response limit applies (UTF-8, CJK characters count as 3).
 
 Parameters:
 - query: SQL SELECT statement (required)
@@ -443,9 +867,13 @@ Parameters:
 
 在 roleplay_daily_reports 视图上执行自定义SQL查询以生成综合性能报告。
 
-返回格式: JSON object with success flag, query, row count, execution time, and data"""
+**Data format**: data is a list of row objects; results with more than 10 rows
+are columnar to save space: {"columns": [...], "rows": [[...], ...]}
+
+返回格式: JSON object with success flag, query, row count, execution time, and data""",
+    structured_output=False
 )
-def execute_custom_query(query: str, row_limit: int = DEFAULT_ROW_LIMIT) -> Dict[str, Any]:
+async def execute_custom_query(query: str, row_limit: int = DEFAULT_ROW_LIMIT) -> str:
     """
     Execute a custom SQL SELECT query on the roleplay_daily_reports view.
 
@@ -457,12 +885,16 @@ def execute_custom_query(query: str, row_limit: int = DEFAULT_ROW_LIMIT) -> Dict
         row_limit: Maximum number of rows to return (default 100, max 1000)
 
     Returns:
-        JSON response containing:
+        JSON string (pre-serialized, returned as text content) containing:
         - success: Boolean indicating query success
         - query: The executed query (with enforced LIMIT)
         - row_count: Number of rows returned
         - execution_time_ms: Query execution time in milliseconds
-        - data: Query results as list of dictionaries
+        - data: Query results as list of dictionaries, or columnar
+          {"columns": [...], "rows": [[...], ...]} for more than COLUMNAR_MIN_ROWS rows
+        - _cache: "hit" when served from the result cache (execution_time_ms is 0)
+        - _more_rows: True when more rows may match but were not fetched because
+          they could not fit in the size limit (row_count is rows fetched)
 
         On error:
         - success: False
@@ -480,24 +912,34 @@ def execute_custom_query(query: str, row_limit: int = DEFAULT_ROW_LIMIT) -> Dict
         # Validate query safety
         is_valid, error_msg = validate_query_safety(query)
         if not is_valid:
-            return format_error_response(
+            return encode_response(format_error_response(
                 error_type="QueryValidationError",
                 message=error_msg,
                 suggestion='请使用 SELECT 查询，例如: SELECT "餐厅完整名称", "总体任务完成率" FROM roleplay_daily_reports WHERE "运营日期"::date = CURRENT_DATE - 1'
-            )
+            ))
 
         # Enforce row limit
-        validated_query = enforce_row_limit(query, min(row_limit, MAX_ROW_LIMIT))
-
-        # Execute query via Supabase
-        result = supabase.rpc('execute_sql', {'query': validated_query}).execute()
+        row_limit = min(row_limit, MAX_ROW_LIMIT)
+        validated_query = enforce_row_limit(query, row_limit)
+
+        # Serve repeated queries from the short-lived result cache (LRU order)
+        cache_key = (validated_query, row_limit)
+        now = time.monotonic()
+        with _CACHE_LOCK:
+            entry = _QUERY_CACHE.get(cache_key)
+            if entry and now - entry[0] < QUERY_CACHE_TTL:
+                _QUERY_CACHE.move_to_end(cache_key)
+                _CACHE_STATS["query"]["hits"] += 1
+                return entry[1]
+            _CACHE_STATS["query"]["misses"] += 1
+
+        # Execute query via Supabase (rows past the size budget stay in the database)
+        data, more_rows = await fetch_query_rows(validated_query)
 
         # Calculate execution time
         end_time = datetime.now()
         execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
 
-        # Extract data
-        data = result.data if hasattr(result, 'data') else []
         row_count = len(data)
 
         # Build response
@@ -506,25 +948,297 @@ def execute_custom_query(query: str, row_limit: int = DEFAULT_ROW_LIMIT) -> Dict
             "query": validated_query,
             "row_count": row_count,
             "execution_time_ms": execution_time_ms,
-            "data": data
+            "data": to_columnar(data)
         }
+        if more_rows:
+            response["_more_rows"] = True
+
+        # Cache successful row results only (execute_sql reports SQL errors as an object),
+        # as the encoded hit payload so hits do no serialization
+        if isinstance(data, list):
+            hit_payload = encode_response(
+                {**response, "execution_time_ms": 0, "_cache": "hit"},
+                rows_key="data"
+            )
+            with _CACHE_LOCK:
+                _QUERY_CACHE[cache_key] = (now, hit_payload)
+                _QUERY_CACHE.move_to_end(cache_key)
+                if len(_QUERY_CACHE) > QUERY_CACHE_MAX:
+                    _QUERY_CACHE.popitem(last=False)
 
-        # Truncate if needed
-        truncated_response, was_truncated = truncate_response(response)
-        if was_truncated:
-            truncated_response["_truncated"] = True
-            truncated_response["_message"] = f"Response was truncated to fit within {CHARACTER_LIMIT} character limit. Original row count: {row_count}"
-
-        return truncated_response
+        # Encode once, dropping rows if needed
+        return encode_response(response, rows_key="data")
 
     except Exception as e:
-        return format_error_response(
+        return encode_response(format_error_response(
             error_type="DatabaseError",
             message=f"Query execution failed: {str(e)}",
             suggestion="请检查SQL语法是否正确，特别注意中文列名需要使用双引号。可以先调用 get_view_schema_and_samples 查看可用的列名。"
+        ))
+
+
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """
+    Parse a YYYY-MM-DD date string.
+
+    Returns:
+        Parsed datetime (midnight), or None if the format is invalid
+    """
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+async def _resolve_restaurants(restaurant_name: str) -> Optional[List[str]]:
+    """
+    Resolve a restaurant name fragment against the known restaurant list.
+
+    The list comes from the cached schema response, so this is normally an
+    in-memory lookup rather than a database round trip.
+
+    Args:
+        restaurant_name: Full name or fragment (e.g., "绵阳")
+
+    Returns:
+        Matching full restaurant names, or None if the list is unavailable
+    """
+    await _load_schema(record_stats=False)
+    with _CACHE_LOCK:
+        known = _RESTAURANT_NAMES.get(VIEW_NAME)
+
+    if not known:
+        return None
+
+    needle = restaurant_name.strip().casefold()
+    return [name for name in known if needle in name.casefold()]
+
+
+async def _fetch_report_rows(restaurant_name: str, start: datetime, end: datetime) -> Dict[str, Any]:
+    """
+    Fetch report rows for a restaurant and inclusive date range.
+
+    Uses a PostgREST table request, so filter values are sent as request
+    parameters instead of being interpolated into SQL.
+
+    Args:
+        restaurant_name: Full name or fragment
+        start: First operating date
+        end: Last operating date (inclusive)
+
+    Returns:
+        Response dictionary (success or formatted error)
+    """
+    start_time = datetime.now()
+
+    # An empty fragment would match every restaurant
+    if not restaurant_name.strip():
+        return format_error_response(
+            error_type="QueryValidationError",
+            message="restaurant_name must not be blank.",
+            suggestion="请提供餐厅名称或名称片段，例如: 绵阳"
+        )
+
+    matches = await _resolve_restaurants(restaurant_name)
+    if matches == []:
+        with _CACHE_LOCK:
+            known = _RESTAURANT_NAMES.get(VIEW_NAME, [])
+        return format_error_response(
+            error_type="QueryValidationError",
+            message=f"No restaurant matches '{restaurant_name}'.",
+            suggestion=f"可用的餐厅: {', '.join(known)}"
         )
 
+    # Half-open range works for date, timestamp and ISO text columns alike
+    request = (
+        supabase.table(VIEW_NAME)
+        .select('*')
+        .gte('运营日期', start.strftime('%Y-%m-%d'))
+        .lt('运营日期', (end + timedelta(days=1)).strftime('%Y-%m-%d'))
+    )
+    if matches is None:
+        request = request.ilike('餐厅完整名称', f'%{restaurant_name.strip()}%')
+    else:
+        request = request.in_('餐厅完整名称', matches)
+    request = request.order('运营日期').order('餐厅完整名称').limit(MAX_ROW_LIMIT)
+
+    result = await asyncio.to_thread(request.execute)
+
+    end_time = datetime.now()
+    execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+
+    data = result.data if hasattr(result, 'data') else []
+
+    return {
+        "success": True,
+        "restaurants": matches if matches is not None else [restaurant_name],
+        "date_range": {
+            "start": start.strftime('%Y-%m-%d'),
+            "end": end.strftime('%Y-%m-%d')
+        },
+        "row_count": len(data),
+        "execution_time_ms": execution_time_ms,
+        "data": to_columnar(data)
+    }
+
+
+@mcp.tool(
+    description="""📅 Get the full daily report for one restaurant on one date - no SQL needed.
+
+Shortcut for the most common report: returns ALL columns of roleplay_daily_reports
+for the matching restaurant(s) on the given operating date. Can be called without
+get_view_schema_and_samples.
+
+Parameters:
+- restaurant_name: Full restaurant name or a fragment (e.g., "绵阳")
+- date: Operating date in YYYY-MM-DD format
+
+获取单个餐厅指定日期的完整日报（无需编写SQL）。
+
+**Data format**: data is a list of row objects; results with more than 10 rows
+are columnar to save space: {"columns": [...], "rows": [[...], ...]}
+
+返回格式: JSON object with success flag, matched restaurants, date range, row count, execution time, and data""",
+    structured_output=False
+)
+async def get_daily_report(restaurant_name: str, date: str) -> str:
+    """
+    Get all report columns for one restaurant on one operating date.
+
+    Args:
+        restaurant_name: Full restaurant name or fragment
+        date: Operating date (YYYY-MM-DD)
+
+    Returns:
+        JSON string (pre-serialized, returned as text content) containing:
+        - success, restaurants, date_range, row_count, execution_time_ms, data
+    """
+    try:
+        report_date = _parse_iso_date(date)
+        if report_date is None:
+            return encode_response(format_error_response(
+                error_type="QueryValidationError",
+                message=f"Invalid date '{date}'. Use YYYY-MM-DD format.",
+                suggestion="例如: 2025-10-21"
+            ))
+
+        response = await _fetch_report_rows(restaurant_name, report_date, report_date)
+        return encode_response(response, rows_key="data")
+
+    except Exception as e:
+        return encode_response(format_error_response(
+            error_type="DatabaseError",
+            message=f"Failed to retrieve daily report: {str(e)}",
+            suggestion="Please check database connection, or use execute_custom_query for custom filters."
+        ))
+
+
+@mcp.tool(
+    description="""📈 Get daily report rows for one restaurant over a date range - no SQL needed.
+
+Shortcut for weekly/monthly trend questions: returns ALL columns of
+roleplay_daily_reports for the matching restaurant(s), one row per operating date,
+ordered by date. Can be called without get_view_schema_and_samples.
+
+Parameters:
+- restaurant_name: Full restaurant name or a fragment (e.g., "绵阳")
+- start: First operating date in YYYY-MM-DD format
+- end: Last operating date in YYYY-MM-DD format (inclusive)
+
+获取单个餐厅在日期范围内的每日报表数据，用于周/月趋势分析（无需编写SQL）。
+
+**Data format**: data is a list of row objects; results with more than 10 rows
+are columnar to save space: {"columns": [...], "rows": [[...], ...]}
+
+返回格式: JSON object with success flag, matched restaurants, date range, row count, execution time, and data""",
+    structured_output=False
+)
+async def get_weekly_trend(restaurant_name: str, start: str, end: str) -> str:
+    """
+    Get all report columns for one restaurant over an inclusive date range.
+
+    Args:
+        restaurant_name: Full restaurant name or fragment
+        start: First operating date (YYYY-MM-DD)
+        end: Last operating date (YYYY-MM-DD, inclusive)
+
+    Returns:
+        JSON string (pre-serialized, returned as text content) containing:
+        - success, restaurants, date_range, row_count, execution_time_ms, data
+    """
+    try:
+        start_date = _parse_iso_date(start)
+        end_date = _parse_iso_date(end)
+        if start_date is None or end_date is None or start_date > end_date:
+            return encode_response(format_error_response(
+                error_type="QueryValidationError",
+                message=f"Invalid date range '{start}' - '{end}'. Use YYYY-MM-DD format with start <= end.",
+                suggestion="例如: start=2025-10-15, end=2025-10-21"
+            ))
+
+        response = await _fetch_report_rows(restaurant_name, start_date, end_date)
+        return encode_response(response, rows_key="data")
+
+    except Exception as e:
+        return encode_response(format_error_response(
+            error_type="DatabaseError",
+            message=f"Failed to retrieve trend data: {str(e)}",
+            suggestion="Please check database connection, or use execute_custom_query for custom filters."
+        ))
+
+
+@mcp.tool(
+    description="""Get hit/miss statistics for the server's response caches.
+
+Diagnostic tool - not needed for normal report generation.
+
+This tool returns:
+- Per-cache hit and miss counters since server start
+- Number of cached entries and their TTL in seconds
+
+获取服务器响应缓存的命中统计信息。
+
+返回格式: JSON object with per-cache statistics""",
+    structured_output=False
+)
+async def get_cache_stats() -> str:
+    """
+    Get hit/miss statistics for the server's response caches.
+
+    Returns:
+        JSON string (pre-serialized, returned as text content) containing:
+        - success: Boolean indicating success
+        - caches: Per-cache hits, misses, hit_rate, entries, and ttl_seconds
+    """
+    with _CACHE_LOCK:
+        snapshot = {
+            "schema": (dict(_CACHE_STATS["schema"]), len(_SCHEMA_CACHE), SCHEMA_CACHE_TTL),
+            "query": (dict(_CACHE_STATS["query"]), len(_QUERY_CACHE), QUERY_CACHE_TTL)
+        }
+
+    caches = {}
+    for name, (stats, entries, ttl) in snapshot.items():
+        total = stats["hits"] + stats["misses"]
+        caches[name] = {
+            **stats,
+            "hit_rate": round(stats["hits"] / total, 4) if total else 0.0,
+            "entries": entries,
+            "ttl_seconds": ttl
+        }
+
+    return encode_response({
+        "success": True,
+        "caches": caches
+    })
+
 
 # Run the server
 if __name__ == "__main__":
+    # Warm the schema cache so the first client call is a cache hit
+    # (this also opens the pooled TCP+TLS connection before the first query)
+    try:
+        asyncio.run(_load_schema(record_stats=False))
+    except Exception:
+        pass  # Failures are not cached; the tool retries on first call
+
     mcp.run()